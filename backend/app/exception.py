@@ -24,12 +24,14 @@ class MissingColumnsOrKeys(Exception):
         Parameters
         ----------
         missing_items : Iterable[str]
-            An iterable of strings of missing columns or keys.
+            An iterable of strings of missing columns or keys. They are converted to
+            strings, so labels such as integers can be listed too, and listed in
+            sorted order in the error message.
 
         message : str, optional
             A custom error message. If not provided, a default message is generated.
         """
-        self.missing_items = ", ".join(map(str, missing_items))
+        self.missing_items = ", ".join(sorted(map(str, missing_items)))
         self.message = message
         if self.message is None:
             self.message = "Missing columns or keys"
@@ -1,21 +1,257 @@
 """"Define the useful functions to scrape ivory coast tourism website
 
+CLASSES
+-------
+- ``TouristSite`` -- Row describing a tourist site
+
+CONSTANTS
+---------
+- ``COLUMNS`` -- Columns of the DataFrame returned by ``scrape_tourism_sites()``
+- ``MAX_CONCURRENT_REQUESTS`` -- Maximum number of detail pages fetched at once
+- ``USE_SELECTOLAX`` -- Whether the detail pages are parsed with selectolax
+
 FUNCTIONS
 ---------
 - ``scrape_tourism_website()`` -- Scrape ivory coast tourism website
+- ``scrape_tourism_sites_async()`` -- Scrape ivory coast tourism website concurrently
 """
 
+import asyncio
+import concurrent.futures
+import html
 import re
+from typing import Callable, NamedTuple
 
-import bs4
 import config
 import pandas as pd
 
 from app import utils
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional
+    _LOOP_FACTORY: Callable[[], asyncio.AbstractEventLoop] | None = None
+else:
+    _LOOP_FACTORY = uvloop.new_event_loop
+
+# Parse the detail pages with selectolax when it is installed, with lxml otherwise.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional
+    USE_SELECTOLAX = False
+else:
+    USE_SELECTOLAX = True
+
 # pylint: disable=no-member
 
 
+class TouristSite(NamedTuple):
+    """Row describing a tourist site, missing data are ``None``."""
+
+    url: str
+    title: str | None
+    picture: str | None
+    description: str | None
+
+
+COLUMNS = list(TouristSite._fields)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Links of the tourist sites are the links whose text contains "lire plus" in any
+# case. The index page is only used for these links, so it is not parsed. Quoted
+# attribute values may contain ">", and the text of a link that is never closed
+# stops at the next link, as in an html parser.
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_LINK_RE = re.compile(
+    r"""<a\s((?:[^>"']|"[^"]*"|'[^']*')*)>((?:(?!<a[\s>]).)*?)</a\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTRIBUTE_RE = re.compile(
+    r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?"""
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+_LIRE_PLUS_RE = re.compile(r"lire\s+plus", re.IGNORECASE)
+
+
+class _TouristSiteTarget:  # pylint: disable=too-many-instance-attributes
+    """lxml parser target extracting the tourist site of a detail page.
+
+    Only the first ``news_content`` div is read: its title (full text of the first
+    link), its picture (source of the first image) and its description (text of
+    the last paragraph). No tree is built for the page.
+
+    Methods
+    -------
+    - __init__(url) -- Initialize the target for the detail page ``url``
+    - start(tag, attrib) -- Handle an opening tag
+    - end(tag) -- Handle a closing tag
+    - data(data) -- Handle a text
+    - close() -- Return the tourist site
+    """
+
+    def __init__(self, url: str) -> None:
+        """Initialize the target for the detail page ``url``."""
+        self.url = url
+        self.found = False
+        self.title: str | None = None
+        self.picture: str | None = None
+        self.description: str | None = None
+        # Depth inside the ``news_content`` div, 0 outside of it.
+        self._depth = 0
+        self._title_parts: list[str] | None = None
+        self._title_depth = 0
+        self._title_done = False
+        self._picture_done = False
+        self._paragraph_parts: list[str] | None = None
+        self._paragraph_depth = 0
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Handle an opening tag."""
+        if not self._depth:
+            classes = attrib.get("class", "").split()
+            if not self.found and tag == "div" and "news_content" in classes:
+                self.found = True
+                self._depth = 1
+            return
+
+        self._depth += 1
+        if tag == "a" and not self._title_done and self._title_parts is None:
+            self._title_parts = []
+            self._title_depth = self._depth
+        elif tag == "img" and not self._picture_done:
+            self.picture = attrib.get("src")
+            self._picture_done = True
+        elif tag == "p" and self._paragraph_parts is None:
+            self._paragraph_parts = []
+            self._paragraph_depth = self._depth
+
+    def end(self, tag: str) -> None:  # pylint: disable=unused-argument
+        """Handle a closing tag."""
+        if not self._depth:
+            return
+
+        if self._title_parts is not None and self._depth == self._title_depth:
+            self.title = "".join(self._title_parts) or None
+            self._title_parts = None
+            self._title_done = True
+        if self._paragraph_parts is not None and self._depth == self._paragraph_depth:
+            self.description = "".join(self._paragraph_parts)
+            self._paragraph_parts = None
+        self._depth -= 1
+
+    def data(self, data: str) -> None:
+        """Handle a text."""
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._paragraph_parts is not None:
+            self._paragraph_parts.append(data)
+
+    def close(self) -> TouristSite | None:
+        """Return the tourist site.
+
+        Returns ``None`` if the page contains no tourist site.
+        """
+        if not self.found:
+            return None
+        return TouristSite(self.url, self.title, self.picture, self.description)
+
+
+def _extract_tourist_site(
+    url: str, tree: "LexborHTMLParser"
+) -> TouristSite | None:
+    """Extract the tourist site of a detail page parsed by selectolax.
+
+    The data extracted are the same as those of ``_TouristSiteTarget``. Returns
+    ``None`` if the page contains no tourist site.
+    """
+    tourist_site = tree.css_first("div.news_content")
+    if tourist_site is None:
+        return None
+
+    title, picture, description = None, None, None
+
+    a = tourist_site.css_first("a")
+    if a is not None:
+        title = a.text() or None
+
+    img = tourist_site.css_first("img")
+    if img is not None:
+        picture = img.attributes.get("src")
+
+    paragraphs = tourist_site.css("p")
+    if paragraphs:
+        description = paragraphs[-1].text()
+
+    return TouristSite(url, title, picture, description)
+
+
+def _scrape_tourist_site(url: str) -> TouristSite | None:
+    """Fetch the detail page ``url`` and extract its tourist site."""
+    if USE_SELECTOLAX:
+        content, encoding = utils.fetch_html_bytes(url)
+        # Without a declared charset, lexbor detects it from the document like lxml.
+        if encoding is None:
+            tree = LexborHTMLParser(content, encoding=True)
+        else:
+            tree = LexborHTMLParser(content.decode(encoding, errors="replace"))
+        return _extract_tourist_site(url, tree)
+    return utils.fetch_and_parse_target(url, _TouristSiteTarget(url))
+
+
+def _find_href(attributes: str) -> str | None:
+    """Find the ``href`` value in the attributes of a link, ``None`` if it has none."""
+    for name, *values in _ATTRIBUTE_RE.findall(attributes):
+        if name.lower() == "href":
+            return "".join(values)
+    return None
+
+
+def _find_tourist_site_links(index: str) -> list[str]:
+    """Find the links of the tourist sites in the html content of the main page."""
+    hrefs = []
+    for attributes, text in _LINK_RE.findall(_COMMENT_RE.sub("", index)):
+        href = _find_href(attributes)
+        if href is not None and _LIRE_PLUS_RE.search(_TAG_RE.sub("", text)):
+            hrefs.append(html.unescape(href))
+    return hrefs
+
+
+async def scrape_tourism_sites_async() -> pd.DataFrame:
+    """Scrape ivory coast tourism website concurrently
+
+    The detail pages of the tourist sites are fetched concurrently by a pool of
+    ``MAX_CONCURRENT_REQUESTS`` threads sharing the connections of ``utils``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame which contains the scraped data, with string columns in which
+        missing values are ``pd.NA``
+    """
+    # Only the configured URL is validated, links are passed to requests as is.
+    index_url = utils.validate_url(config.IVORY_COAST_URL)
+
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_REQUESTS
+    ) as executor:
+        index = await loop.run_in_executor(
+            executor, utils.fetch_html_content, index_url
+        )
+        hrefs = _find_tourist_site_links(index)
+
+        tourist_sites = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _scrape_tourist_site, href)
+                for href in hrefs
+            )
+        )
+
+    rows = [row for row in tourist_sites if row is not None]
+    # Rows are tuples, pandas does not have to look up their fields by key.
+    return pd.DataFrame(rows, columns=COLUMNS, dtype="string")
+
+
 def scrape_tourism_sites() -> pd.DataFrame:
     """Scrape ivory coast tourism website
 
@@ -24,39 +260,10 @@ def scrape_tourism_sites() -> pd.DataFrame:
     Returns
     -------
     pandas.DataFrame
-        DataFrame which contains the scraped data
+        DataFrame which contains the scraped data, with string columns in which
+        missing values are ``pd.NA``
     """
-    tourist_sites = pd.DataFrame()
-    soup = utils.fetch_and_parse(config.IVORY_COAST_URL)
-    links = soup.find_all("a", string=re.compile("lire plus", re.IGNORECASE))
-    for link in links:
-        soup = utils.fetch_and_parse(link["href"])
-        tourist_site = soup.find("div", class_="news_content")
-        if isinstance(tourist_site, bs4.element.Tag):
-            title, picture, description = None, None, None
-
-            a = tourist_site.find("a")
-            if isinstance(a, bs4.element.Tag):
-                title = a.string
-
-            img = tourist_site.find("img")
-            if isinstance(img, bs4.element.Tag):
-                picture = img["src"]
-
-            try:
-                describe_content = tourist_site.contents[-2]
-            except IndexError:
-                pass
-            else:
-                description = describe_content.get_text()
-
-            tourist_sites = utils.append_row_dataframe(
-                tourist_sites,
-                {
-                    "url": link["href"],
-                    "title": title,
-                    "picture": picture,
-                    "description": description,
-                },
-            )
-    return tourist_sites
+    # uvloop, when installed, runs the event loop. It does not speed up the scraping:
+    # the loop only waits for the pages, which are fetched in worker threads.
+    with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+        return runner.run(scrape_tourism_sites_async())
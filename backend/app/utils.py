@@ -8,17 +8,39 @@ Functions
 - ``add_row_dataframe(data, row) `` -- Appends ``row`` to ``data`` and returns a new
                                        DataFrame.
 
+- ``append_rows_dataframe(data, rows)`` -- Appends ``rows`` to ``data`` at once and
+                                           returns a new DataFrame.
+
+- ``validate_url(url)`` -- Validate ``url`` as an HTTP URL.
+
 - ``fetch_html_content(url, timeout)`` -- Retrieve the html content from the ``url``.
 
-- ``fetch_and_parse(url)`` -- Fetches HTML content from url and parses it.
+- ``fetch_html_bytes(url, timeout)`` -- Retrieve the raw html content from the ``url``
+                                      and its declared charset.
+
+- ``fetch_and_parse_streaming(url, timeout)`` -- Parses the html content of ``url``
+                                                while it is downloaded.
+
+- ``fetch_and_parse_target(url, target, timeout)`` -- Parses the html content of
+                                                     ``url`` with a parser ``target``.
+
+- ``fetch_and_parse(url)`` -- Fetches HTML content from url and parses it, cached
+                               for the whole process.
 """
 
-from typing import Optional
+import functools
+import warnings
+import weakref
+from typing import IO, Any, Optional, cast
 
 import requests
+import requests.adapters
+import urllib3.util
 import pydantic
-import bs4
+import lxml.etree
+import lxml.html
 import pandas as pd
+from pandas.errors import PerformanceWarning
 
 
 from app.exception import MissingColumnsOrKeys
@@ -26,8 +48,28 @@ from app import types_
 
 # pylint: disable=no-member
 
+# Shared session: keeps connections alive between requests to the same host.
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=urllib3.util.Retry(
+        total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+_URL_ADAPTER = pydantic.TypeAdapter(pydantic.HttpUrl)
 
-def append_row_dataframe(data: pd.DataFrame, row: dict) -> pd.DataFrame:
+# Number of rows appended one by one to a DataFrame, by ``id`` of the DataFrame.
+_APPEND_CALL_COUNTER: dict[int, int] = {}
+_APPEND_CALL_WARNING_THRESHOLD = 20
+
+
+def append_row_dataframe(
+    data: pd.DataFrame, row: dict, expected_columns: Optional[frozenset[str]] = None
+) -> pd.DataFrame:
     """Append ``row`` in ``data``.
 
     Appends a new ``row`` to the end of the DataFrame ``data``.
@@ -38,6 +80,9 @@ def append_row_dataframe(data: pd.DataFrame, row: dict) -> pd.DataFrame:
         DataFrame in which to append ``row``.
     row : dict
         The ``row`` to be added.
+    expected_columns : frozenset[str], optional
+        The columns of ``data``. Callers appending many rows with the same schema
+        can compute it once instead of on every call.
 
     Returns
     -------
@@ -51,9 +96,16 @@ def append_row_dataframe(data: pd.DataFrame, row: dict) -> pd.DataFrame:
     MissingColumnsOrKeys
         If the columns of ``data`` or keys of ``row`` are missing.
 
+    Warns
+    -----
+    PerformanceWarning
+        If more than 20 rows were appended one by one to the same DataFrame.
+
     Notes
     ----
-    The returned dataframe indexes are reset.
+    The returned dataframe indexes are reset. Appending rows one at a time copies
+    the whole DataFrame on each call, ``append_rows_dataframe`` should be used to
+    append many rows.
 
     Examples
     --------
@@ -76,35 +128,154 @@ def append_row_dataframe(data: pd.DataFrame, row: dict) -> pd.DataFrame:
     if not isinstance(row, dict):
         raise TypeError("row must be a dictionary")
 
-    df_row = pd.DataFrame([row])
-    if not data.empty:
-        # Checking keys and columns
-        extra_keys = set(row.keys()) - set(data.columns)
-        missing_keys = set(data.columns) - set(row.keys())
-        if extra_keys:
-            raise MissingColumnsOrKeys(
-                extra_keys, "These keys are not columns of the DataFrame"
-            )
-        if missing_keys:
+    if data.empty:
+        result = pd.DataFrame([row])
+    else:
+        result = append_rows_dataframe(data, [row], expected_columns)
+
+    # Count the appends made on ``data`` and on the DataFrames it comes from.
+    count = _APPEND_CALL_COUNTER.get(id(data), 0) + 1
+    _count_appends(data, count)
+    _count_appends(result, count)
+    if count > _APPEND_CALL_WARNING_THRESHOLD:
+        warnings.warn(
+            "append_row_dataframe called repeatedly on the same DataFrame, use "
+            "append_rows_dataframe with a batched list[dict] instead",
+            PerformanceWarning,
+            stacklevel=2,
+        )
+    return result
+
+
+def _count_appends(data: pd.DataFrame, count: int) -> None:
+    """Record that ``count`` rows were appended one by one to build ``data``."""
+    key = id(data)
+    if key not in _APPEND_CALL_COUNTER:
+        # Forget the count when ``data`` is garbage collected, its id can be reused.
+        weakref.finalize(data, _APPEND_CALL_COUNTER.pop, key, None)
+    _APPEND_CALL_COUNTER[key] = count
+
+
+def append_rows_dataframe(
+    data: pd.DataFrame,
+    rows: list[dict],
+    expected_columns: Optional[frozenset[str]] = None,
+) -> pd.DataFrame:
+    """Append ``rows`` in ``data``.
+
+    Appends all ``rows`` to the end of the DataFrame ``data`` with a single
+    concatenation, which is much faster than calling ``append_row_dataframe`` once
+    per row.
+
+    Parameters
+    ----------
+    data : DataFrame
+        DataFrame in which to append ``rows``.
+    rows : list[dict]
+        The ``rows`` to be added.
+    expected_columns : frozenset[str], optional
+        The columns of ``data``. Computed from ``data`` if not provided.
+
+    Returns
+    -------
+    DataFrame
+        DataFrame with the new ``rows`` appended.
+
+    Raises
+    ------
+    TypeError
+        If ``data`` is not a DataFrame or ``rows`` a list of dict.
+    MissingColumnsOrKeys
+        If the columns of ``data`` or keys of a row are missing.
+
+    Notes
+    ----
+    The returned dataframe indexes are reset.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> data = pd.DataFrame({"col1": [1], "col2": [4]})
+    >>> rows = [{"col1": 2, "col2": 5}, {"col1": 3, "col2": 6}]
+    >>> append_rows_dataframe(data, rows)
+       col1  col2
+    0     1     4
+    1     2     5
+    2     3     6
+    """
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("data must be a DataFrame")
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise TypeError("rows must be a list of dictionaries")
+
+    if not rows:
+        return data.reset_index(drop=True)
+    if data.empty:
+        return pd.DataFrame(rows)
+
+    # Checking keys and columns
+    if expected_columns is None:
+        expected_columns = frozenset(data.columns)
+    for row in rows:
+        mismatched_keys = row.keys() ^ expected_columns
+        if mismatched_keys:
+            extra_keys = mismatched_keys - expected_columns
+            if extra_keys:
+                raise MissingColumnsOrKeys(
+                    extra_keys, "These keys are not columns of the DataFrame"
+                )
             raise MissingColumnsOrKeys(
-                missing_keys, "These columns are not dictionary keys"
+                mismatched_keys, "These columns are not dictionary keys"
             )
 
-    return pd.concat([data, df_row], ignore_index=True)
+    return pd.concat(
+        [data, pd.DataFrame(rows, columns=data.columns)], ignore_index=True
+    )
+
+
+def validate_url(url: str | pydantic.HttpUrl) -> str:
+    """Validate ``url`` as an HTTP URL.
+
+    The fetch functions do not validate their ``url``, so it should be validated
+    once where it enters the application, e.g. from the configuration.
+
+    Parameters
+    ----------
+    url: str or pydantic.HttpUrl
+        The ``url`` to validate.
+
+    Returns
+    -------
+    str
+        The normalized ``url``.
+
+    Raises
+    ------
+    pydantic.ValidationError
+       if ``url`` is invalid
+
+    Examples
+    --------
+    >>> validate_url("https://tourisme.gouv.ci/accueil/sitetouristique")
+    'https://tourisme.gouv.ci/accueil/sitetouristique'
+    """
+    return str(_URL_ADAPTER.validate_python(url))
 
 
 def fetch_html_content(
-    url: pydantic.HttpUrl, timeout: Optional[int] = 10
+    url: str | pydantic.HttpUrl, timeout: Optional[int] = 10
 ) -> types_.HTML:
     """Retrieve the html content from the ``url``.
 
     This function returns a HTML content or raises an exception
-    if an error occurs (invalid URL, timeout, etc.).
+    if an error occurs (invalid URL, timeout, etc.). Requests go through a shared
+    session, so connections to the same host are reused.
 
     Parameters
     ----------
-    url: pydantic.HttpUrl
-        ``url`` of which we wish to retrieve html content.
+    url: str or pydantic.HttpUrl
+        ``url`` of which we wish to retrieve html content. It is not validated
+        again, see ``validate_url``.
 
     timeout: int, default=10
         Maximum waiting time in seconds before interruption.
@@ -116,25 +287,247 @@ def fetch_html_content(
 
     Raises
     ------
-    pydantic.ValidationError
-       if ``url`` is invalid
+    requests.exceptions.MissingSchema
+        If ``url`` has no scheme, e.g. ``www.example.org``.
+
+    requests.exceptions.InvalidSchema
+        If ``url`` is not an http or https url, e.g. ``ftp://example.org``.
+
+    requests.exceptions.InvalidURL
+        If ``url`` is malformed, e.g. ``http://``.
 
     requests.ConnectionError
-        If the service is unavailable (503 error).
+        If the connection to the service fails.
 
     requests.Timeout
         If the request times out (408 error).
 
     requests.HTTPError
         If the request not found (404 error).
+
+    requests.exceptions.RetryError
+        If the service still answers with a retried status (429, 500, 502, 503 or
+        504, e.g. 503 when it is unavailable) once the session retries are used up.
     """
-    response = requests.get(url, timeout=timeout)  # type: ignore
+    response = _SESSION.get(url, timeout=timeout)  # type: ignore
     if response.status_code != requests.codes.OK:
         response.raise_for_status()
 
     return types_.HTML(response.text)
 
 
-def fetch_and_parse(url: pydantic.HttpUrl):
-    """Fetches HTML content and parses it with BeautifulSoup."""
-    return bs4.BeautifulSoup(fetch_html_content(url), "lxml")
+def fetch_html_bytes(
+    url: str | pydantic.HttpUrl, timeout: Optional[int] = 10
+) -> tuple[bytes, Optional[str]]:
+    """Retrieve the raw html content from the ``url`` and its declared charset.
+
+    Unlike ``fetch_html_content``, the body is not decoded: without a charset in the
+    ``Content-Type`` header, requests would decode it as ISO-8859-1, whereas the
+    parser can detect the charset from the document, as ``fetch_and_parse_streaming``
+    does.
+
+    Parameters
+    ----------
+    url: str or pydantic.HttpUrl
+        ``url`` of which we wish to retrieve html content. It is not validated
+        again, see ``validate_url``.
+
+    timeout: int, default=10
+        Maximum waiting time in seconds before interruption.
+
+    Returns
+    -------
+    tuple[bytes, str or None]
+        The raw html content and the charset of the ``Content-Type`` header,
+        ``None`` if the header declares none.
+
+    Raises
+    ------
+    requests.exceptions.MissingSchema
+        If ``url`` has no scheme, e.g. ``www.example.org``.
+
+    requests.exceptions.InvalidSchema
+        If ``url`` is not an http or https url, e.g. ``ftp://example.org``.
+
+    requests.exceptions.InvalidURL
+        If ``url`` is malformed, e.g. ``http://``.
+
+    requests.ConnectionError
+        If the connection to the service fails.
+
+    requests.Timeout
+        If the request times out (408 error).
+
+    requests.HTTPError
+        If the request not found (404 error).
+
+    requests.exceptions.RetryError
+        If the service still answers with a retried status (429, 500, 502, 503 or
+        504, e.g. 503 when it is unavailable) once the session retries are used up.
+    """
+    response = _SESSION.get(url, timeout=timeout)  # type: ignore
+    if response.status_code != requests.codes.OK:
+        response.raise_for_status()
+
+    return response.content, _declared_encoding(response)
+
+
+def fetch_and_parse_streaming(
+    url: str | pydantic.HttpUrl, timeout: Optional[int] = 10
+) -> lxml.html.HtmlElement:
+    """Parses the html content of ``url`` while it is downloaded.
+
+    The response body is streamed into the lxml parser instead of being loaded as a
+    whole string first, which lowers the peak memory on large pages. An empty
+    document is parsed as an empty ``<html>`` element.
+
+    Parameters
+    ----------
+    url: str or pydantic.HttpUrl
+        ``url`` of which we wish to parse the html content. It is not validated
+        again, see ``validate_url``.
+
+    timeout: int, default=10
+        Maximum waiting time in seconds before interruption.
+
+    Returns
+    -------
+    lxml.html.HtmlElement
+        The root element of the parsed document.
+
+    Raises
+    ------
+    requests.exceptions.MissingSchema
+        If ``url`` has no scheme, e.g. ``www.example.org``.
+
+    requests.exceptions.InvalidSchema
+        If ``url`` is not an http or https url, e.g. ``ftp://example.org``.
+
+    requests.exceptions.InvalidURL
+        If ``url`` is malformed, e.g. ``http://``.
+
+    requests.ConnectionError
+        If the connection to the service fails.
+
+    requests.Timeout
+        If the request times out (408 error).
+
+    requests.HTTPError
+        If the request not found (404 error).
+
+    requests.exceptions.RetryError
+        If the service still answers with a retried status (429, 500, 502, 503 or
+        504, e.g. 503 when it is unavailable) once the session retries are used up.
+    """
+    root = _parse_streaming(url, timeout).getroot()
+    if root is None:
+        return lxml.html.Element("html")
+    return root
+
+
+def fetch_and_parse_target(
+    url: str | pydantic.HttpUrl, target: Any, timeout: Optional[int] = 10
+) -> Any:
+    """Parses the html content of ``url`` with a parser ``target``.
+
+    The streamed response body is parsed by an lxml parser which sends its events
+    (``start``, ``end``, ``data``, etc.) to ``target`` instead of building a tree,
+    so only the data the ``target`` keeps is stored.
+
+    Parameters
+    ----------
+    url: str or pydantic.HttpUrl
+        ``url`` of which we wish to parse the html content. It is not validated
+        again, see ``validate_url``.
+
+    target: Any
+        An lxml parser target, see
+        https://lxml.de/parsing.html#the-target-parser-interface.
+
+    timeout: int, default=10
+        Maximum waiting time in seconds before interruption.
+
+    Returns
+    -------
+    Any
+        The value returned by the ``close()`` method of ``target``.
+
+    Raises
+    ------
+    requests.exceptions.MissingSchema
+        If ``url`` has no scheme, e.g. ``www.example.org``.
+
+    requests.exceptions.InvalidSchema
+        If ``url`` is not an http or https url, e.g. ``ftp://example.org``.
+
+    requests.exceptions.InvalidURL
+        If ``url`` is malformed, e.g. ``http://``.
+
+    requests.ConnectionError
+        If the connection to the service fails.
+
+    requests.Timeout
+        If the request times out (408 error).
+
+    requests.HTTPError
+        If the request not found (404 error).
+
+    requests.exceptions.RetryError
+        If the service still answers with a retried status (429, 500, 502, 503 or
+        504, e.g. 503 when it is unavailable) once the session retries are used up.
+    """
+    return _parse_streaming(url, timeout, target)
+
+
+def _parse_streaming(
+    url: str | pydantic.HttpUrl, timeout: Optional[int], target: Any = None
+) -> Any:
+    """Streams the response body of ``url`` into an lxml html parser."""
+    response = _SESSION.get(url, stream=True, timeout=timeout)  # type: ignore
+    try:
+        if response.status_code != requests.codes.OK:
+            response.raise_for_status()
+
+        response.raw.decode_content = True
+        return lxml.etree.parse(
+            cast(IO[bytes], response.raw),
+            lxml.html.HTMLParser(encoding=_declared_encoding(response), target=target),
+        )
+    finally:
+        response.close()
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Returns the charset of the ``Content-Type`` header of ``response``.
+
+    ``None`` if the header declares none, so that the parser detects it from the
+    document instead of using the ISO-8859-1 default of requests.
+    """
+    if "charset" in response.headers.get("content-type", "").lower():
+        return response.encoding
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_and_parse_cached(url: str) -> lxml.html.HtmlElement:
+    """Fetches and parses ``url``, memoized by ``fetch_and_parse``."""
+    return fetch_and_parse_streaming(url)
+
+
+def fetch_and_parse(url: str | pydantic.HttpUrl) -> lxml.html.HtmlElement:
+    """Fetches HTML content and parses it with lxml.
+
+    An empty document is parsed as an empty ``<html>`` element.
+
+    Warnings
+    --------
+    The parsed trees of the last 256 URLs are cached for the whole process, without
+    expiry: a cached URL is never fetched again, so later changes to its page are not
+    seen until ``fetch_and_parse.cache_clear()`` is called. Use
+    ``fetch_and_parse_streaming`` for pages that must be up to date. The cached trees
+    are shared between callers and must not be modified.
+    """
+    return _fetch_and_parse_cached(str(url))
+
+
+fetch_and_parse.cache_clear = _fetch_and_parse_cached.cache_clear  # type: ignore
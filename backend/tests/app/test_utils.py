@@ -4,13 +4,20 @@ This module defines several tests for the ``utils.py`` module in the ``backend/a
 package.
 """
 
+import http.server
+import io
 import re
+import threading
+import warnings
 from unittest.mock import MagicMock, Mock
 
 import pytest
 import requests
+import requests.adapters
+import urllib3.util
 import pydantic
 import pandas as pd
+from pandas.errors import PerformanceWarning
 from pytest_mock.plugin import MockerFixture
 
 import config
@@ -72,6 +79,21 @@ class TestAppendRowToDataFrame:
                 {"col1": 3, "col3": 4},
                 "These keys are not columns of the DataFrame: col3.",
             ),
+            (
+                pd.DataFrame([{"col1": 1, "col2": 2, "col3": 5, "col4": 6}]),
+                {"col1": 3},
+                "These columns are not dictionary keys: col2, col3, col4.",
+            ),
+            (
+                pd.DataFrame({0: [1], 1: [2]}),
+                {0: 3},
+                "These columns are not dictionary keys: 1.",
+            ),
+            (
+                pd.DataFrame({"col1": [1], 2: [2], "col3": [3]}),
+                {"col1": 3},
+                "These columns are not dictionary keys: 2, col3.",
+            ),
         ],
     )
     def test_missing_columns_or_keys(
@@ -135,6 +157,255 @@ class TestAppendRowToDataFrame:
         """
         assert utils.append_row_dataframe(data, row).equals(expected_value)
 
+    def test_performance_warning(self) -> None:
+        """Test the ``PerformanceWarning`` raised when appending rows one by one.
+
+        Only the appends after the 20th on the same DataFrame must emit a warning.
+        """
+        data = pd.DataFrame()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", PerformanceWarning)
+            for i in range(20):
+                data = utils.append_row_dataframe(data, {"col1": i})
+
+        with pytest.warns(PerformanceWarning, match="append_rows_dataframe"):
+            data = utils.append_row_dataframe(data, {"col1": 20})
+        assert data["col1"].tolist() == list(range(21))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", PerformanceWarning)
+            utils.append_row_dataframe(pd.DataFrame(), {"col1": 0})
+
+
+class TestAppendRowsToDataFrame:
+    """Test class for the `append_rows_dataframe` function."""
+
+    @pytest.mark.parametrize(
+        "data, rows, error_msg",
+        [
+            ([1, 2], [{"col1": 3, "col2": 4}], "data must be a DataFrame"),
+            (
+                pd.DataFrame([{"col1": 1, "col2": 2}]),
+                {"col1": 3, "col2": 4},
+                "rows must be a list of dictionaries",
+            ),
+            (
+                pd.DataFrame([{"col1": 1, "col2": 2}]),
+                [{"col1": 3, "col2": 4}, {43, 547, 1}],
+                "rows must be a list of dictionaries",
+            ),
+        ],
+    )
+    def test_type_error(
+        self, data: pd.DataFrame, rows: list[dict], error_msg: str
+    ) -> None:
+        """Test the raising of the TypeError exception.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The DataFrame to which rows are being appended.
+        rows : list[dict]
+            The ``rows`` of data being appended to the DataFrame.
+        error_msg : str
+            The expected error message for the TypeError.
+        """
+        with pytest.raises(TypeError) as excinfo:
+            utils.append_rows_dataframe(data, rows)
+        assert str(excinfo.value) == error_msg
+
+    @pytest.mark.parametrize(
+        "data, rows, error_msg",
+        [
+            (
+                pd.DataFrame([{"col1": 1, "col2": 2, "col3": 5}]),
+                [{"col1": 3, "col2": 4, "col3": 6}, {"col1": 3, "col2": 4}],
+                "These columns are not dictionary keys: col3.",
+            ),
+            (
+                pd.DataFrame([{"col1": 1, "col2": 2}]),
+                [{"col1": 3, "col2": 4}, {"col1": 3, "col3": 4}],
+                "These keys are not columns of the DataFrame: col3.",
+            ),
+        ],
+    )
+    def test_missing_columns_or_keys(
+        self, data: pd.DataFrame, rows: list[dict], error_msg: str
+    ) -> None:
+        """Test the raising of the ``MissingColumnsOrKeys`` exception.
+
+        Every row of ``rows`` must have exactly the columns of ``data`` as keys.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The DataFrame to which rows are being appended.
+        rows : list[dict]
+            The rows of data being appended to the DataFrame.
+        error_msg : str
+            The expected error message for the ``MissingColumnsOrKeys``.
+        """
+        with pytest.raises(exception.MissingColumnsOrKeys) as excinfo:
+            utils.append_rows_dataframe(data, rows)
+
+        value = re.sub(r"\{|\}|'", "", str(excinfo.value))
+        assert value == error_msg
+
+    @pytest.mark.parametrize(
+        "data, rows, expected_value",
+        [
+            (
+                pd.DataFrame(),
+                [{"col1": 8, "col2": 10}, {"col1": 9, "col2": 11}],
+                pd.DataFrame({"col1": [8, 9], "col2": [10, 11]}),
+            ),
+            (
+                pd.DataFrame({"col1": [1, 2], "col2": [4, 5]}),
+                [{"col2": 6, "col1": 3}],
+                pd.DataFrame({"col1": [1, 2, 3], "col2": [4, 5, 6]}),
+            ),
+            (
+                pd.DataFrame({"col1": [1, 2], "col2": [4, 5]}),
+                [],
+                pd.DataFrame({"col1": [1, 2], "col2": [4, 5]}),
+            ),
+        ],
+    )
+    def test_succed(
+        self, data: pd.DataFrame, rows: list[dict], expected_value: pd.DataFrame
+    ) -> None:
+        """Test append of rows to data.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The DataFrame to which rows are being appended.
+        rows : list[dict]
+            The rows of data being appended to the DataFrame.
+        expected_value : DataFrame
+            The expected result after the append of the ``rows`` in ``data``.
+        """
+        assert utils.append_rows_dataframe(data, rows).equals(expected_value)
+
+    def test_expected_columns(self) -> None:
+        """Test that precomputed ``expected_columns`` are used for the validation."""
+        data = pd.DataFrame({"col1": [1], "col2": [4]})
+        rows = [{"col1": 2, "col2": 5}, {"col1": 3, "col2": 6}]
+        expected_columns = frozenset(data.columns)
+
+        result = utils.append_rows_dataframe(data, rows, expected_columns)
+        assert result.equals(pd.DataFrame({"col1": [1, 2, 3], "col2": [4, 5, 6]}))
+
+        with pytest.raises(exception.MissingColumnsOrKeys):
+            utils.append_row_dataframe(data, {"col1": 2}, expected_columns)
+
+
+class TestValidateUrl:
+    """Test class for the `validate_url` function."""
+
+    @pytest.mark.parametrize(
+        "url, expected_value",
+        [
+            ("https://www.mock-adress.org/page", "https://www.mock-adress.org/page"),
+            (
+                pydantic.HttpUrl("https://www.mock-adress.org"),
+                "https://www.mock-adress.org/",
+            ),
+            (config.IVORY_COAST_URL, str(config.IVORY_COAST_URL)),
+        ],
+    )
+    def test_valid_url(self, url: str | pydantic.HttpUrl, expected_value: str) -> None:
+        """Test that a valid ``url`` is returned as a string.
+
+        Parameters
+        ----------
+        url: str or pydantic.HttpUrl
+            The ``url`` to validate.
+        expected_value: str
+            The expected normalized ``url``.
+        """
+        assert utils.validate_url(url) == expected_value
+
+    @pytest.mark.parametrize("url", ["www.mock-adress.org", "ftp://mock-adress.org"])
+    def test_invalid_url(self, url: str) -> None:
+        """Test the raising of the ``pydantic.ValidationError`` exception.
+
+        Parameters
+        ----------
+        url: str
+            An invalid HTTP ``url``.
+        """
+        with pytest.raises(pydantic.ValidationError):
+            utils.validate_url(url)
+
+
+class TestSession:
+    """Test class for the shared session used by the fetch functions."""
+
+    @pytest.mark.parametrize(
+        "url", ["http://www.mock-adress.org", "https://www.mock-adress.org"]
+    )
+    def test_adapter(self, url: str) -> None:
+        """Test that requests to ``url`` go through the pooled, retrying adapter.
+
+        Parameters
+        ----------
+        url: str
+            An HTTP or HTTPS ``url``.
+        """
+        adapter = utils._SESSION.get_adapter(url)  # pylint: disable=protected-access
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+
+        retry = adapter.max_retries
+        assert isinstance(retry, urllib3.util.Retry)
+        assert retry.total == 3
+        assert retry.backoff_factor == 0.3
+        assert retry.status_forcelist == [429, 500, 502, 503, 504]
+
+    def test_retry_error(self, mocker: MockerFixture) -> None:
+        """Test that a service still unavailable after the retries raises a RetryError.
+
+        A local server answers every request with a 503 status code, the request
+        must be sent once and retried 3 times.
+
+        Parameters
+        ----------
+        mocker: MockerFixture
+            Fixture to mock the behavior of external dependencies.
+        """
+        paths: list[str] = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """Answer every GET request with a 503 status code."""
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """Handle a GET request."""
+                paths.append(self.path)
+                self.send_response(requests.codes.service_unavailable)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args: object) -> None:
+                """Do not log the requests."""
+
+        # pylint: disable=protected-access
+        mocker.patch.object(utils._ADAPTER.max_retries, "backoff_factor", 0)
+        with http.server.HTTPServer(("127.0.0.1", 0), Handler) as server:
+            thread = threading.Thread(
+                target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+            )
+            thread.start()
+            try:
+                with pytest.raises(requests.exceptions.RetryError):
+                    utils.fetch_html_content(
+                        f"http://127.0.0.1:{server.server_address[1]}/page"
+                    )
+            finally:
+                server.shutdown()
+
+        assert paths == ["/page"] * 4
+
 
 class TestFetcHtmlContent:
     """Test class for the `fetch_html_content` function."""
@@ -264,3 +535,183 @@ class TestFetcHtmlContent:
             utils.fetch_html_content(config.IVORY_COAST_URL)
 
         mock_get.assert_called_once_with(config.IVORY_COAST_URL, timeout=10)
+
+
+class TestFetchHtmlBytes:
+    """Test class for the `fetch_html_bytes` function."""
+
+    @pytest.mark.parametrize(
+        "headers, expected_encoding",
+        [
+            ({}, None),
+            ({"content-type": "text/html"}, None),
+            ({"content-type": "text/html; charset=utf-8"}, "utf-8"),
+        ],
+    )
+    def test_get_200_ok(
+        self,
+        mock_requests_get: tuple[MagicMock, Mock],
+        headers: dict,
+        expected_encoding: str | None,
+    ) -> None:
+        """Test the raw html content and the charset declared by the headers.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+        headers: dict
+            The headers of the response.
+        expected_encoding: str or None
+            The expected charset, ``None`` when the headers declare none.
+        """
+        content = "<h1>Côte d'Ivoire</h1>".encode()
+
+        mock_get, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.ok
+        mock_response.headers = headers
+        mock_response.encoding = expected_encoding or "ISO-8859-1"
+        mock_response.content = content
+
+        result = utils.fetch_html_bytes(config.IVORY_COAST_URL)
+        mock_get.assert_called_once_with(config.IVORY_COAST_URL, timeout=10)
+        assert result == (content, expected_encoding)
+
+
+class TestFetchAndParseStreaming:
+    """Test class for the `fetch_and_parse_streaming` function."""
+
+    @pytest.mark.parametrize(
+        "content, headers, expected_value",
+        [
+            (
+                "<html><body><h1>Titre</h1></body></html>".encode(),
+                {},
+                "Titre",
+            ),
+            (
+                '<meta charset="utf-8"><h1>Côte d\'Ivoire</h1>'.encode(),
+                {},
+                "Côte d'Ivoire",
+            ),
+            (
+                "<h1>Côte d'Ivoire</h1>".encode("latin-1"),
+                {"content-type": "text/html; charset=ISO-8859-1"},
+                "Côte d'Ivoire",
+            ),
+        ],
+    )
+    def test_get_200_ok(
+        self,
+        mock_requests_get: tuple[MagicMock, Mock],
+        content: bytes,
+        headers: dict,
+        expected_value: str,
+    ) -> None:
+        """Test the parsing of the streamed html content of the ``url``.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+        content: bytes
+            The raw body of the response.
+        headers: dict
+            The headers of the response.
+        expected_value: str
+            The expected text of the ``<h1>`` element.
+        """
+        mock_get, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.ok
+        mock_response.headers = headers
+        mock_response.encoding = "ISO-8859-1"
+        mock_response.raw = io.BytesIO(content)
+
+        root = utils.fetch_and_parse_streaming(config.IVORY_COAST_URL)
+        mock_get.assert_called_once_with(
+            config.IVORY_COAST_URL, stream=True, timeout=10
+        )
+        mock_response.close.assert_called_once()
+        assert root.findtext(".//h1") == expected_value
+
+    def test_get_404_not_found(self, mock_requests_get: tuple[MagicMock, Mock]) -> None:
+        """Test the 404 (Not Found) response.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request not found (404 error).
+        """
+        _, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.not_found
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "404 Not Found"
+        )
+
+        with pytest.raises(requests.HTTPError, match="404 Not Found"):
+            utils.fetch_and_parse_streaming(config.IVORY_COAST_URL)
+        mock_response.close.assert_called_once()
+
+
+class TestFetchAndParse:
+    """Test class for the `fetch_and_parse` function."""
+
+    def test_parse(self, mock_requests_get: tuple[MagicMock, Mock]) -> None:
+        """Test the parsing of the html content of the ``url``.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+        """
+        _, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.ok
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(b"<html><body><h1>Title</h1></body></html>")
+
+        root = utils.fetch_and_parse(config.IVORY_COAST_URL)
+        assert root.findtext(".//h1") == "Title"
+
+    def test_empty_document(self, mock_requests_get: tuple[MagicMock, Mock]) -> None:
+        """Test that an empty html content is parsed as an empty ``<html>`` element.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+        """
+        _, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.ok
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(b"")
+
+        root = utils.fetch_and_parse(config.IVORY_COAST_URL)
+        assert root.tag == "html"
+        assert len(root) == 0
+
+    def test_cache(self, mock_requests_get: tuple[MagicMock, Mock]) -> None:
+        """Test that the same ``url`` is fetched and parsed only once.
+
+        Parameters
+        ----------
+        mock_requests_get: tuple[MagicMock, Mock]
+            A pytest fixture that mocks the requests.get method for testing purposes.
+        """
+        mock_get, mock_response = mock_requests_get
+        mock_response.status_code = requests.codes.ok
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(b"<html><body><h1>Title</h1></body></html>")
+
+        first = utils.fetch_and_parse(config.IVORY_COAST_URL)
+        second = utils.fetch_and_parse(str(config.IVORY_COAST_URL))
+        mock_get.assert_called_once()
+        assert first is second
+
+        utils.fetch_and_parse.cache_clear()  # type: ignore
+        utils.fetch_and_parse(config.IVORY_COAST_URL)
+        assert mock_get.call_count == 2
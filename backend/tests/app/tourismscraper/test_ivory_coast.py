@@ -1,16 +1,84 @@
 """Define the unit tests to retrieve data from the tourist site of Ivory Coast."""
 
-import bs4
+import io
+from typing import Mapping
+from unittest.mock import MagicMock, Mock
+
 import pytest
+import requests
 import pandas as pd
 from pytest_mock.plugin import MockerFixture
 
+import config
 from app.tourismscraper import ivory_coast
 from app import types_
 
 # pylint: disable=no-member
 
 
+@pytest.fixture(autouse=True, params=[False, True], ids=["lxml", "selectolax"])
+def use_selectolax(request: pytest.FixtureRequest, mocker: MockerFixture) -> bool:
+    """Run each test with the detail pages parsed by lxml then by selectolax.
+
+    Parameters
+    ----------
+    request: pytest.FixtureRequest
+        The request of the fixture, whose ``param`` tells whether to use selectolax.
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+
+    Returns
+    -------
+    bool
+        Whether the detail pages are parsed with selectolax.
+    """
+    if request.param:
+        pytest.importorskip("selectolax.lexbor")
+    mocker.patch.object(ivory_coast, "USE_SELECTOLAX", request.param)
+    return request.param
+
+
+def mock_pages(
+    mocker: MockerFixture,
+    pages: Mapping[str, str],
+    content_type: str = "text/html; charset=utf-8",
+) -> MagicMock:
+    """Mock the HTTP session so that each URL of ``pages`` returns its HTML content.
+
+    The content is encoded in UTF-8 and, as requests does, decoded with the charset
+    of ``content_type``, ISO-8859-1 if it declares none.
+
+    Parameters
+    ----------
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+    pages: Mapping[str, str]
+        Simulated HTML content of each page, by URL.
+    content_type: str, default="text/html; charset=utf-8"
+        The ``Content-Type`` header of the responses.
+
+    Returns
+    -------
+    MagicMock
+        The object replacing the ``get`` method of the session.
+    """
+
+    def get(url: str, **_: object) -> Mock:
+        headers = {"content-type": content_type}
+        encoding = requests.utils.get_encoding_from_headers(headers)
+        content = pages[str(url)].encode()
+        return mocker.Mock(
+            status_code=requests.codes.ok,
+            headers=headers,
+            encoding=encoding,
+            content=content,
+            text=content.decode(encoding or "utf-8", errors="replace"),
+            raw=io.BytesIO(content),
+        )
+
+    return mocker.patch("app.utils._SESSION.get", side_effect=get)
+
+
 @pytest.mark.parametrize(
     "first_response, detail_response",
     [
@@ -40,11 +108,11 @@ def test_empty_response(
     detail_response: str
         Simulated HTML content of the detail page response.
     """
-    mock = mocker.patch("app.utils.fetch_and_parse")
-    mock.side_effect = [
-        bs4.BeautifulSoup(first_response, "lxml"),
-        bs4.BeautifulSoup(detail_response, "lxml"),
-    ]
+    pages = {
+        str(config.IVORY_COAST_URL): first_response,
+        "https://tourist_site.com/1": detail_response,
+    }
+    mock = mock_pages(mocker, pages)
     result = ivory_coast.scrape_tourism_sites()
     mock.assert_called()
     assert isinstance(result, pd.DataFrame)
@@ -128,12 +196,12 @@ def test_non_empty_response(
     detail_seconde_response: str
         Simulated HTML content of the detail page response tourist site.
     """
-    mock = mocker.patch("app.utils.fetch_and_parse")
-    mock.side_effect = [
-        bs4.BeautifulSoup(first_response, "lxml"),
-        bs4.BeautifulSoup(detail_frist_response, "lxml"),
-        bs4.BeautifulSoup(detail_seconde_response, "lxml"),
-    ]
+    pages = {
+        str(config.IVORY_COAST_URL): first_response,
+        "https://tourist_site.com/1": detail_frist_response,
+        "https://tourist_site.com/2": detail_seconde_response,
+    }
+    mock = mock_pages(mocker, pages)
     result = ivory_coast.scrape_tourism_sites()
     url = result["url"].iloc[0]
     title = result["title"].iloc[0]
@@ -144,6 +212,178 @@ def test_non_empty_response(
     assert isinstance(result, pd.DataFrame)
     assert len(result) in [1, 2]
     assert url == "https://tourist_site.com/1"
-    assert title in [None, "Titre du site 1"], f"Unexpected title: {title}"
-    assert picture in [None, "https://tourist_site.com/1/detail/image_site.jpg"]
-    assert description in [None, "Description du site touristique 1."]
+    assert (result.dtypes == "string").all()
+    assert pd.isna(title) or title == "Titre du site 1", f"Unexpected title: {title}"
+    assert (
+        pd.isna(picture) or picture == "https://tourist_site.com/1/detail/image_site.jpg"
+    )
+    assert pd.isna(description) or (
+        description == "Description du site touristique 1."
+    )
+
+
+@pytest.mark.parametrize(
+    "detail_response, expected_value",
+    [
+        (
+            """<div class="header"><a href="/">Accueil</a><p>Menu</p></div>
+               <div class="row news_content">
+                    <a href="#">Titre du site 1</a>
+                    <img src="https://tourist_site.com/1/detail/image_site.jpg" />
+                    <img src="https://tourist_site.com/1/detail/autre_image.jpg" />
+                    <p>Introduction.</p>
+                    <p>Description du <b>site</b> touristique 1.</p>
+                </div>
+                <div class="footer"><a href="/">Contact</a><p>Footer</p></div>""",
+            (
+                "Titre du site 1",
+                "https://tourist_site.com/1/detail/image_site.jpg",
+                "Description du site touristique 1.",
+            ),
+        ),
+        (
+            """<div class="news_content">
+                    <a href="#">Titre <span>du site</span> 1</a>
+                    <div><p>Description <span>imbriquée</span>.</p></div>
+                </div>""",
+            ("Titre du site 1", None, "Description imbriquée."),
+        ),
+        (
+            """<div class="news_content"><a><span>Titre du site</span></a></div>""",
+            ("Titre du site", None, None),
+        ),
+        (
+            """<div class="news_content"><a href="#"></a><img /></div>""",
+            (None, None, None),
+        ),
+    ],
+)
+def test_tourist_site_fields(
+    mocker: MockerFixture,
+    detail_response: types_.HTML,
+    expected_value: tuple[str | None, str | None, str | None],
+) -> None:
+    """Test the data extracted from the detail page of a tourist site.
+
+    Only the first ``news_content`` div of the page must be read: the title is the
+    full text of its first link, the picture the source of its first image and the
+    description the text of its last paragraph.
+
+    Parameters
+    ----------
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+    detail_response: str
+        Simulated HTML content of the detail page response tourist site.
+    expected_value: tuple[str | None, str | None, str | None]
+        The expected title, picture and description of the tourist site.
+    """
+    pages = {
+        str(config.IVORY_COAST_URL): (
+            '<a href="https://tourist_site.com/1">LIRE PLUS</a>'
+        ),
+        "https://tourist_site.com/1": detail_response,
+    }
+    mock_pages(mocker, pages)
+    result = ivory_coast.scrape_tourism_sites()
+
+    assert len(result) == 1
+    row = result.iloc[0]
+    values = tuple(
+        None if pd.isna(row[column]) else row[column] for column in ivory_coast.COLUMNS
+    )
+    assert values == ("https://tourist_site.com/1", *expected_value)
+
+
+def test_charset_without_header(mocker: MockerFixture) -> None:
+    """Test a detail page whose ``Content-Type`` header declares no charset.
+
+    requests then decodes the page as ISO-8859-1, so both parsers must detect the
+    charset from the document instead.
+
+    Parameters
+    ----------
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+    """
+    pages = {
+        str(config.IVORY_COAST_URL): (
+            '<a href="https://tourist_site.com/1">Lire plus</a>'
+        ),
+        "https://tourist_site.com/1": """<html><head><meta charset="utf-8"></head>
+            <body><div class="news_content">
+                <a href="#">Côte d'Ivoire</a>
+                <p>Plage à Assinie.</p>
+            </div></body></html>""",
+    }
+    mock_pages(mocker, pages, content_type="text/html")
+    result = ivory_coast.scrape_tourism_sites()
+
+    assert result["title"].tolist() == ["Côte d'Ivoire"]
+    assert result["description"].tolist() == ["Plage à Assinie."]
+
+
+def test_index_links(mocker: MockerFixture) -> None:
+    """Test the links of the tourist sites extracted from the main page.
+
+    Only the links whose text contains "lire plus", in any case and possibly
+    around child tags, must be followed. Commented out links must be ignored, an
+    unclosed link must not swallow the next one, and ``>`` in quoted attribute
+    values or unquoted ``href`` values must not break the links.
+
+    Parameters
+    ----------
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+    """
+    pages = {
+        str(config.IVORY_COAST_URL): """
+            <a href="https://tourist_site.com/1?id=1&amp;lang=fr">Lire plus</a>
+            <a href="https://tourist_site.com/contact">Contact</a>
+            <a data-href="#" href='https://tourist_site.com/2'> lire  PLUS &raquo;</a>
+            <a href="https://tourist_site.com/l'ile-boulay">Lire plus</a>
+            <a class="btn" href="https://tourist_site.com/4"><i class="icon"></i> Lire
+                plus</a>
+            <!-- <a href="https://tourist_site.com/old">Lire plus</a> -->
+            <a href="/home">Accueil<a href="https://tourist_site.com/5">Lire plus</a>
+            <a title="x > y" href="https://tourist_site.com/6">Lire plus</a>
+            <a href=https://tourist_site.com/7>Lire plus</a>
+        """,
+        "https://tourist_site.com/1?id=1&lang=fr": '<div class="news_content"></div>',
+        "https://tourist_site.com/2": '<div class="news_content"></div>',
+        "https://tourist_site.com/l'ile-boulay": '<div class="news_content"></div>',
+        "https://tourist_site.com/4": '<div class="news_content"></div>',
+        "https://tourist_site.com/5": '<div class="news_content"></div>',
+        "https://tourist_site.com/6": '<div class="news_content"></div>',
+        "https://tourist_site.com/7": '<div class="news_content"></div>',
+    }
+    mock = mock_pages(mocker, pages)
+    result = ivory_coast.scrape_tourism_sites()
+
+    assert mock.call_count == 8
+    assert result["url"].tolist() == [
+        "https://tourist_site.com/1?id=1&lang=fr",
+        "https://tourist_site.com/2",
+        "https://tourist_site.com/l'ile-boulay",
+        "https://tourist_site.com/4",
+        "https://tourist_site.com/5",
+        "https://tourist_site.com/6",
+        "https://tourist_site.com/7",
+    ]
+
+
+def test_uvloop(mocker: MockerFixture) -> None:
+    """Test that the scraper runs on an uvloop event loop when uvloop is installed.
+
+    Parameters
+    ----------
+    mocker: MockerFixture
+        Fixture to mock the behavior of external dependencies.
+    """
+    uvloop = pytest.importorskip("uvloop")
+    # pylint: disable-next=protected-access
+    assert ivory_coast._LOOP_FACTORY is uvloop.new_event_loop
+
+    mock_pages(mocker, {str(config.IVORY_COAST_URL): "<html><body></body></html>"})
+    result = ivory_coast.scrape_tourism_sites()
+    assert result.empty is True
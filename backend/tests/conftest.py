@@ -1,18 +1,33 @@
 """Define global fixtures
 """
 
+from typing import Iterator
 from unittest.mock import Mock, MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
+from app import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_and_parse_cache() -> Iterator[None]:
+    """Empty the cache of ``utils.fetch_and_parse`` around each test.
+
+    Pages are mocked per test, so a tree parsed by a previous test must never be
+    returned.
+    """
+    utils.fetch_and_parse.cache_clear()  # type: ignore
+    yield
+    utils.fetch_and_parse.cache_clear()  # type: ignore
+
 
 @pytest.fixture(name="mock_requests_get")
 def mock_requests_method_get(mocker: MockerFixture) -> tuple[MagicMock, Mock]:
-    """Create Mock of ``requests.get``
+    """Create Mock of ``requests.Session.get``
 
-    Fixture to replace the requests.get function with a mocked version returning a
-    custom response.
+    Fixture to replace the ``get`` method of the session shared by ``app.utils``
+    with a mocked version returning a custom response.
 
     Parameters
     ----------
@@ -22,11 +37,11 @@ def mock_requests_method_get(mocker: MockerFixture) -> tuple[MagicMock, Mock]:
     Returns
     -------
     tuple[MagicMock, Mock]
-        Two mock objects are returned: the object replacing requests.get and associated
-        the object response.
+        Two mock objects are returned: the object replacing the session ``get`` and
+        the associated response object.
 
     """
-    mock_get = mocker.patch("requests.get")
+    mock_get = mocker.patch("app.utils._SESSION.get")
     mock_response = mocker.Mock()
     mock_get.return_value = mock_response
     return mock_get, mock_response